@@ -17,8 +17,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
-import jsonschema
-
 DEFAULT_INSTALL_DIR = "~/.claude"
 
 
@@ -79,6 +77,8 @@ def load_config(path: str) -> Dict[str, Any]:
     Schema is searched in the config directory first, then alongside this file.
     """
 
+    import jsonschema  # deferred: heavy import, only needed here
+
     config_path = Path(path).expanduser().resolve()
     config = _load_json(config_path)
 
@@ -234,6 +234,8 @@ def op_copy_dir(op: Dict[str, Any], ctx: Dict[str, Any]) -> None:
         return
 
     dst.parent.mkdir(parents=True, exist_ok=True)
+    # Real copies, not hardlinks: installed files must not share inodes with
+    # the source checkout. copy2 already uses in-kernel copies where available.
     shutil.copytree(src, dst, dirs_exist_ok=True)
     if not existed_before:
         _record_created(dst, ctx)
@@ -294,6 +296,8 @@ def op_run_command(op: Dict[str, Any], ctx: Dict[str, Any]) -> None:
         env=env,
         capture_output=True,
         text=True,
+        # Python fds are non-inheritable by default; skip the fd-table sweep on POSIX.
+        close_fds=sys.platform == "win32",
     )
 
     write_log(
@@ -311,19 +315,47 @@ def op_run_command(op: Dict[str, Any], ctx: Dict[str, Any]) -> None:
         raise RuntimeError(f"Command failed with code {result.returncode}: {command}")
 
 
-def write_log(entry: Dict[str, Any], ctx: Dict[str, Any]) -> None:
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write may write less than asked; loop until every byte is out."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def open_log(ctx: Dict[str, Any]) -> None:
+    """Keep the log open for the whole run; write_log reuses ctx["log_fd"]."""
     log_path = Path(ctx["log_file"])
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    ctx["log_fd"] = os.open(log_path, flags, 0o644)
+
 
+def close_log(ctx: Dict[str, Any]) -> None:
+    log_fd = ctx.pop("log_fd", None)
+    if log_fd is not None:
+        os.close(log_fd)
+
+
+def write_log(entry: Dict[str, Any], ctx: Dict[str, Any]) -> None:
     ts = datetime.now().isoformat()
     level = entry.get("level", "INFO")
     message = entry.get("message", "")
 
-    with log_path.open("a", encoding="utf-8") as fh:
-        fh.write(f"[{ts}] {level}: {message}\n")
-        for key in ("stdout", "stderr", "returncode"):
-            if key in entry and entry[key] not in (None, ""):
-                fh.write(f"  {key}: {entry[key]}\n")
+    lines = [f"[{ts}] {level}: {message}\n"]
+    for key in ("stdout", "stderr", "returncode"):
+        if key in entry and entry[key] not in (None, ""):
+            lines.append(f"  {key}: {entry[key]}\n")
+    data = "".join(lines).encode("utf-8")
+
+    log_fd = ctx.get("log_fd")
+    if log_fd is not None:
+        _write_all(log_fd, data)
+        return
+
+    log_path = Path(ctx["log_file"])
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("ab", buffering=0) as fh:
+        _write_all(fh.fileno(), data)
 
 
 def write_status(results: List[Dict[str, Any]], ctx: Dict[str, Any]) -> None:
@@ -334,8 +366,9 @@ def write_status(results: List[Dict[str, Any]], ctx: Dict[str, Any]) -> None:
 
     status_path = Path(ctx["status_file"])
     status_path.parent.mkdir(parents=True, exist_ok=True)
-    with status_path.open("w", encoding="utf-8") as fh:
-        json.dump(status, fh, indent=2, ensure_ascii=False)
+    status_path.write_bytes(
+        json.dumps(status, indent=2, ensure_ascii=False).encode("utf-8")
+    )
 
 
 def prepare_status_backup(ctx: Dict[str, Any]) -> None:
@@ -400,26 +433,35 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
 
     prepare_status_backup(ctx)
 
-    results: List[Dict[str, Any]] = []
-    for name, cfg in modules.items():
-        try:
-            results.append(execute_module(name, cfg, ctx))
-        except Exception:  # noqa: BLE001
-            if not args.force:
-                rollback(ctx)
-                return 1
-            rollback(ctx)
-            results.append(
-                {
-                    "module": name,
-                    "status": "failed",
-                    "operations": [],
-                    "installed_at": datetime.now().isoformat(),
-                }
-            )
-            break
+    try:
+        open_log(ctx)
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to open log file: {exc}", file=sys.stderr)
+        return 1
 
-    write_status(results, ctx)
+    try:
+        results: List[Dict[str, Any]] = []
+        for name, cfg in modules.items():
+            try:
+                results.append(execute_module(name, cfg, ctx))
+            except Exception:  # noqa: BLE001
+                if not args.force:
+                    rollback(ctx)
+                    return 1
+                rollback(ctx)
+                results.append(
+                    {
+                        "module": name,
+                        "status": "failed",
+                        "operations": [],
+                        "installed_at": datetime.now().isoformat(),
+                    }
+                )
+                break
+
+        write_status(results, ctx)
+    finally:
+        close_log(ctx)
     return 0
 
 
@@ -11,15 +11,23 @@ Usage:
     python3 gemini.py "<prompt>"
     ./gemini.py "your prompt"
 """
+import shutil
 import subprocess
 import sys
 import os
+import threading
+import time
 
 DEFAULT_MODEL = os.environ.get('GEMINI_MODEL', 'gemini-3-pro-preview')
+PASSTHROUGH = os.environ.get('GEMINI_PASSTHROUGH') == '1'
 DEFAULT_WORKDIR = '.'
-TIMEOUT_MS = 7_200_000  # 固定 2 小时，毫秒
+TIMEOUT_MS = 7_200_000  # 默认 2 小时，毫秒，可用 GEMINI_TIMEOUT 覆盖
 DEFAULT_TIMEOUT = TIMEOUT_MS // 1000
 FORCE_KILL_DELAY = 5
+MS_THRESHOLD = 10_000  # 无单位且大于该值的 GEMINI_TIMEOUT 按毫秒处理（与 CODEX_TIMEOUT 一致）
+READ_CHUNK_SIZE = 64 * 1024
+EXIT_STDOUT_CLOSED = 141  # 与 shell 中 SIGPIPE 退出的 128+13 一致
+PIPE_SIZE = 1 << 20
 
 
 def log_error(message: str):
@@ -49,6 +57,33 @@ def parse_args():
     }
 
 
+def resolve_timeout() -> int:
+    """解析 GEMINI_TIMEOUT（秒），支持 ms/s 后缀，无后缀时大数值按毫秒处理"""
+    raw = os.environ.get('GEMINI_TIMEOUT')
+    if not raw:
+        return DEFAULT_TIMEOUT
+
+    value = raw.strip().lower()
+    if value.endswith('ms'):
+        digits, scale = value[:-2], 1000
+    elif value.endswith('s'):
+        digits, scale = value[:-1], 1
+    else:
+        digits, scale = value, None
+
+    try:
+        parsed = int(digits)
+    except ValueError:
+        parsed = 0
+    if parsed <= 0:
+        log_warn(f"Invalid GEMINI_TIMEOUT '{raw}', falling back to {DEFAULT_TIMEOUT}s")
+        return DEFAULT_TIMEOUT
+
+    if scale is None:
+        scale = 1000 if parsed > MS_THRESHOLD else 1
+    return max(parsed // scale, 1)
+
+
 def build_gemini_args(args) -> list:
     """构建 gemini CLI 参数"""
     return [
@@ -58,13 +93,113 @@ def build_gemini_args(args) -> list:
     ]
 
 
+def enlarge_pipe(fd: int):
+    """尽量调大管道缓冲区（仅 Linux），减少 read 系统调用次数"""
+    try:
+        import fcntl
+    except ImportError:
+        return
+    # F_SETPIPE_SZ 在 Python 3.10 才加入 fcntl，旧版本直接用 Linux 常量值
+    setpipe_sz = getattr(fcntl, 'F_SETPIPE_SZ', 1031 if sys.platform.startswith('linux') else None)
+    if setpipe_sz is None:
+        return
+    try:
+        fcntl.fcntl(fd, setpipe_sz, PIPE_SIZE)
+    except OSError:
+        pass
+
+
+class LineFlushWriter:
+    """包装二进制输出流，写入的块中含换行时才 flush
+
+    输出端关闭（如下游 `| head` 退出）后不再写入，只丢弃数据，保证管道
+    继续被排空、子进程不会因管道写满而阻塞；首次写失败时调用 on_broken。
+    """
+
+    def __init__(self, out, on_broken=None):
+        self.out = out
+        self.on_broken = on_broken
+        self.broken = False
+
+    def write(self, chunk) -> int:
+        if not self.broken:
+            try:
+                self.out.write(chunk)
+                if b'\n' in chunk:
+                    self.out.flush()
+            except OSError:
+                self.mark_broken()
+        return len(chunk)
+
+    def flush(self):
+        if not self.broken:
+            try:
+                self.out.flush()
+            except OSError:
+                self.mark_broken()
+
+    def mark_broken(self):
+        self.broken = True
+        if self.on_broken is not None:
+            self.on_broken()
+
+
+def pump_stream(stream, out, on_broken=None):
+    """以原始字节块把子进程管道透传到 out，遇到换行才 flush"""
+    enlarge_pipe(stream.fileno())
+    writer = LineFlushWriter(out, on_broken)
+    # stream 为无缓冲管道，每次 read 即一次 os.read，有数据就返回
+    shutil.copyfileobj(stream, writer, READ_CHUNK_SIZE)
+    writer.flush()
+
+
+def start_pumps(process, stdout_closed) -> list:
+    """为 stdout/stderr 各启动一个后台透传线程
+
+    stdout 读端关闭时设置 stdout_closed 并结束子进程，与管道中 SIGPIPE 语义一致；
+    stderr 关闭只丢弃输出，不影响子进程。
+    """
+    def on_stdout_closed():
+        stdout_closed.set()
+        process.kill()
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pumps = [
+        threading.Thread(
+            target=pump_stream,
+            args=(process.stdout, sys.stdout.buffer, on_stdout_closed),
+            daemon=True
+        ),
+        threading.Thread(target=pump_stream, args=(process.stderr, sys.stderr.buffer), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+    return pumps
+
+
+def join_pumps(pumps: list) -> list:
+    """限时等待透传线程写完剩余数据，所有线程共享一个截止时间，返回仍未结束的线程"""
+    deadline = time.monotonic() + FORCE_KILL_DELAY
+    for pump in pumps:
+        pump.join(timeout=max(0, deadline - time.monotonic()))
+    return [pump for pump in pumps if pump.is_alive()]
+
+
+def silence_stdout():
+    """stdout 读端已关闭：把 fd 重定向到 devnull，避免退出时 flush 报 BrokenPipeError"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
 def main():
     log_info('Script started')
     args = parse_args()
     log_info(f"Prompt length: {len(args['prompt'])}")
     log_info(f"Working dir: {args['workdir']}")
     gemini_args = build_gemini_args(args)
-    timeout_sec = DEFAULT_TIMEOUT
+    timeout_sec = resolve_timeout()
     log_info(f"Timeout: {timeout_sec}s")
 
     # 如果指定了工作目录，切换到该目录
@@ -82,27 +217,51 @@ def main():
     try:
         log_info(f"Starting gemini with model {DEFAULT_MODEL}")
         process = None
-        # 启动 gemini 子进程，直接透传 stdout 和 stderr
-        process = subprocess.Popen(
-            gemini_args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # 行缓冲
-        )
-
-        # 实时输出 stdout
-        for line in process.stdout:
-            sys.stdout.write(line)
+        pumps = []
+        stdout_closed = threading.Event()
+        if PASSTHROUGH:
+            # 子进程直接继承 stdout/stderr，输出不经过 wrapper 拷贝；
+            # 超时时 subprocess.run 会自行 kill 并回收子进程
             sys.stdout.flush()
+            sys.stderr.flush()
+            returncode = subprocess.run(
+                gemini_args,
+                timeout=timeout_sec,
+                close_fds=sys.platform == 'win32'
+            ).returncode
+        else:
+            # 启动 gemini 子进程，直接透传 stdout 和 stderr
+            process = subprocess.Popen(
+                gemini_args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=False,  # 纯字节透传，无需解码再编码
+                bufsize=0,
+                # Python 创建的 fd 默认不可继承，POSIX 下跳过逐个关闭 fd 的开销
+                close_fds=sys.platform == 'win32'
+            )
+
+            # 后台线程并发实时透传 stdout/stderr，主线程只负责带超时等待，
+            # 既避免管道写满导致子进程阻塞，也保证超时能真正生效
+            pumps = start_pumps(process, stdout_closed)
+
+            # 等待进程结束
+            returncode = process.wait(timeout=timeout_sec)
 
-        # 等待进程结束
-        returncode = process.wait(timeout=timeout_sec)
+            # 正常退出时 stdout 必须完整透传：不设时限，读到 EOF 为止（下游再慢也等）；
+            # stderr 只限时等待
+            stdout_pump, stderr_pump = pumps
+            stdout_pump.join()
+            unfinished = join_pumps([stderr_pump])
 
-        # 读取 stderr
-        stderr_output = process.stderr.read()
-        if stderr_output:
-            sys.stderr.write(stderr_output)
+            if stdout_closed.is_set():
+                silence_stdout()
+                log_error('stdout closed by reader, gemini terminated')
+                sys.exit(EXIT_STDOUT_CLOSED)
+
+            if unfinished:
+                log_warn('stderr still open after gemini exited, output may be incomplete')
+                sys.exit(returncode or 1)
 
         # 检查退出码
         if returncode != 0:
@@ -114,11 +273,11 @@ def main():
     except subprocess.TimeoutExpired:
         log_error(f'Gemini execution timeout ({timeout_sec}s)')
         if process is not None:
+            # SIGKILL 后 wait 必定返回，再排空管道中剩余输出
             process.kill()
-            try:
-                process.wait(timeout=FORCE_KILL_DELAY)
-            except subprocess.TimeoutExpired:
-                pass
+            process.wait()
+            if join_pumps(pumps):
+                log_warn('Output pipes still open after kill, output may be incomplete')
         sys.exit(124)
 
     except FileNotFoundError:
@@ -0,0 +1,16 @@
+import os
+import shutil
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = ROOT / "config.json"
+SCHEMA_PATH = ROOT / "config.schema.json"
+
+
+def link_schema(dst: Path) -> None:
+    """Place the repo schema at dst; tests never modify it, so a hardlink will do."""
+    try:
+        os.link(SCHEMA_PATH, dst)
+    except OSError:
+        shutil.copy(SCHEMA_PATH, dst)
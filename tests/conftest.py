@@ -0,0 +1,5 @@
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "slow: spawns subprocesses via run_command; run in parallel with `pytest -n auto -m slow`",
+    )
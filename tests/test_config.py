@@ -1,31 +1,41 @@
-import copy
+import functools
 import json
+import os
 import unittest
+from collections import defaultdict
 from pathlib import Path
 
-import jsonschema
 
-
-CONFIG_PATH = Path(__file__).resolve().parents[1] / "config.json"
-SCHEMA_PATH = Path(__file__).resolve().parents[1] / "config.schema.json"
-ROOT = CONFIG_PATH.parent
+# Kept local (not from _paths) so this unittest module runs without pytest's sys.path setup.
+ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = ROOT / "config.json"
+SCHEMA_PATH = ROOT / "config.schema.json"
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    with CONFIG_PATH.open(encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(CONFIG_PATH.read_bytes())
 
 
+@functools.lru_cache(maxsize=1)
 def load_schema():
-    with SCHEMA_PATH.open(encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(SCHEMA_PATH.read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def load_validator():
+    # jsonschema is slow to import; defer it until a test validates something.
+    import jsonschema
+
+    schema = load_schema()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 class ConfigSchemaTest(unittest.TestCase):
     def test_config_matches_schema(self):
-        config = load_config()
-        schema = load_schema()
-        jsonschema.validate(config, schema)
+        load_validator().validate(load_config())
 
     def test_required_modules_present(self):
         modules = load_config()["modules"]
@@ -57,19 +67,37 @@ class ConfigSchemaTest(unittest.TestCase):
 
     def test_operation_sources_exist_on_disk(self):
         config = load_config()
+        by_parent = defaultdict(list)
         for module in config["modules"].values():
             for op in module["operations"]:
                 if op["type"] in {"copy_dir", "copy_file"}:
                     path = (ROOT / op["source"]).expanduser()
+                    by_parent[path.parent].append(path)
+
+        # One directory listing per parent instead of one stat per source.
+        for parent, paths in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except FileNotFoundError:
+                for path in paths:
+                    self.assertTrue(path.exists(), f"Source path not found: {path}")
+                continue
+            for path in paths:
+                entry = entries.get(path.name)
+                self.assertIsNotNone(entry, f"Source path not found: {path}")
+                if entry.is_symlink():
+                    # A listed link may dangle; require its target to exist.
                     self.assertTrue(path.exists(), f"Source path not found: {path}")
 
     def test_schema_rejects_invalid_operation_type(self):
-        config = load_config()
-        invalid = copy.deepcopy(config)
+        import jsonschema
+
+        # JSON round-trip copy: load_config() is cached and must not be mutated.
+        invalid = json.loads(json.dumps(load_config()))
         invalid["modules"]["dev"]["operations"][0]["type"] = "unknown_op"
-        schema = load_schema()
         with self.assertRaises(jsonschema.exceptions.ValidationError):
-            jsonschema.validate(invalid, schema)
+            load_validator().validate(invalid)
 
 
 if __name__ == "__main__":
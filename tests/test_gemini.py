@@ -0,0 +1,152 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from _paths import ROOT
+
+
+GEMINI_SCRIPT = ROOT / "skills" / "gemini" / "scripts" / "gemini.py"
+
+FAKE_GEMINI = """\
+import os, sys, time
+mode = os.environ["FAKE_GEMINI_MODE"]
+out, err = sys.stdout.buffer, sys.stderr.buffer
+if mode == "burst":
+    out.write(b"x" * 900000 + b"done\\n")
+elif mode == "flood_both":
+    for _ in range(200):
+        out.write(b"o" * 10000)
+        err.write(b"e" * 10000)
+elif mode == "endless":
+    while True:
+        out.write(b"y" * 4096 + b"\\n")
+elif mode == "sleep":
+    time.sleep(30)
+"""
+
+
+def _load_gemini():
+    spec = importlib.util.spec_from_file_location("gemini", GEMINI_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+gemini = _load_gemini()
+
+
+def test_resolve_timeout_default(monkeypatch):
+    monkeypatch.delenv("GEMINI_TIMEOUT", raising=False)
+    assert gemini.resolve_timeout() == gemini.DEFAULT_TIMEOUT
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("120s", 120),
+        ("7200000ms", 7200),
+        ("1500MS", 1),
+        ("120", 120),
+        ("10000", 10000),
+        ("10001", 10),
+        ("7200000", 7200),
+    ],
+)
+def test_resolve_timeout_units(monkeypatch, raw, expected):
+    monkeypatch.setenv("GEMINI_TIMEOUT", raw)
+    assert gemini.resolve_timeout() == expected
+
+
+@pytest.mark.parametrize("raw", ["0", "0s", "-5", "abc", "s", "ms", "12h"])
+def test_resolve_timeout_invalid_falls_back(monkeypatch, capsys, raw):
+    monkeypatch.setenv("GEMINI_TIMEOUT", raw)
+    assert gemini.resolve_timeout() == gemini.DEFAULT_TIMEOUT
+    assert "Invalid GEMINI_TIMEOUT" in capsys.readouterr().err
+
+
+@pytest.fixture()
+def fake_gemini_env(tmp_path):
+    """Put an executable fake `gemini` first on PATH; FAKE_GEMINI_MODE selects its behaviour."""
+
+    fake = tmp_path / "bin" / "gemini"
+    fake.parent.mkdir()
+    fake.write_text(f"#!{sys.executable}\n{FAKE_GEMINI}", encoding="utf-8")
+    fake.chmod(0o755)
+
+    env = os.environ.copy()
+    env["PATH"] = f"{fake.parent}{os.pathsep}{env.get('PATH', '')}"
+    env.pop("GEMINI_TIMEOUT", None)
+    env.pop("GEMINI_PASSTHROUGH", None)
+
+    def make(mode, **extra):
+        return {**env, "FAKE_GEMINI_MODE": mode, **extra}
+
+    return make
+
+
+def _spawn_wrapper(env, **kwargs):
+    return subprocess.Popen([sys.executable, str(GEMINI_SCRIPT), "prompt"], env=env, **kwargs)
+
+
+posix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="fake gemini relies on a shebang script"
+)
+
+
+@pytest.mark.slow
+@posix_only
+def test_wrapper_delivers_full_burst_to_slow_reader(fake_gemini_env):
+    # The child exits long before the reader drains; stdout must still arrive in full.
+    proc = _spawn_wrapper(
+        fake_gemini_env("burst"), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    time.sleep(8)
+    data = proc.stdout.read()
+    proc.stdout.close()
+    assert proc.wait(timeout=10) == 0
+    assert len(data) == 900005
+    assert data.endswith(b"done\n")
+
+
+@pytest.mark.slow
+@posix_only
+def test_wrapper_drains_stdout_and_stderr_floods(fake_gemini_env):
+    result = subprocess.run(
+        [sys.executable, str(GEMINI_SCRIPT), "prompt"],
+        env=fake_gemini_env("flood_both"),
+        capture_output=True,
+        timeout=30,
+    )
+    assert result.returncode == 0
+    assert result.stdout == b"o" * 2_000_000
+    assert b"e" * 2_000_000 in result.stderr
+
+
+@pytest.mark.slow
+@posix_only
+def test_wrapper_exits_141_when_reader_closes(fake_gemini_env):
+    proc = _spawn_wrapper(
+        fake_gemini_env("endless"), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    assert proc.stdout.read(20)
+    proc.stdout.close()
+    assert proc.wait(timeout=10) == 141
+
+
+@pytest.mark.slow
+@posix_only
+def test_wrapper_times_out_with_124(fake_gemini_env):
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, str(GEMINI_SCRIPT), "prompt"],
+        env=fake_gemini_env("sleep", GEMINI_TIMEOUT="2s"),
+        capture_output=True,
+        timeout=30,
+    )
+    assert result.returncode == 124
+    assert time.monotonic() - start < 10
+    assert b"Gemini execution timeout (2s)" in result.stderr
@@ -1,22 +1,22 @@
 import json
 import os
-import shutil
+import re
 import sys
 from pathlib import Path
 
 import pytest
 
 import install
+from _paths import link_schema
 
 
-ROOT = Path(__file__).resolve().parents[1]
-SCHEMA_PATH = ROOT / "config.schema.json"
+_LIST_OUTPUT_RE = re.compile(r"dev|essentials|✓")
 
 
 def write_config(tmp_path: Path, config: dict) -> Path:
     cfg_path = tmp_path / "config.json"
-    cfg_path.write_text(json.dumps(config), encoding="utf-8")
-    shutil.copy(SCHEMA_PATH, tmp_path / "config.schema.json")
+    cfg_path.write_bytes(json.dumps(config).encode("utf-8"))
+    link_schema(tmp_path / "config.schema.json")
     return cfg_path
 
 
@@ -126,15 +126,15 @@ def test_load_config_success(valid_config):
 def test_load_config_invalid_json(tmp_path):
     bad = tmp_path / "bad.json"
     bad.write_text("{broken", encoding="utf-8")
-    shutil.copy(SCHEMA_PATH, tmp_path / "config.schema.json")
+    link_schema(tmp_path / "config.schema.json")
     with pytest.raises(ValueError):
         install.load_config(str(bad))
 
 
 def test_load_config_schema_error(tmp_path):
     cfg = tmp_path / "cfg.json"
-    cfg.write_text(json.dumps({"version": "1.0"}), encoding="utf-8")
-    shutil.copy(SCHEMA_PATH, tmp_path / "config.schema.json")
+    cfg.write_bytes(json.dumps({"version": "1.0"}).encode("utf-8"))
+    link_schema(tmp_path / "config.schema.json")
     with pytest.raises(ValueError):
         install.load_config(str(cfg))
 
@@ -149,25 +149,26 @@ def test_resolve_paths_respects_priority(tmp_path):
     cfg_path = write_config(tmp_path, config)
     args = install.parse_args(["--config", str(cfg_path)])
 
+    expected_root = tmp_path.resolve()
+    expected_install_dir = expected_root / "from_config"
+
     ctx = install.resolve_paths(config, args)
-    assert ctx["install_dir"] == (tmp_path / "from_config").resolve()
-    assert ctx["log_file"] == (tmp_path / "from_config" / "logs" / "install.log").resolve()
-    assert ctx["config_dir"] == tmp_path.resolve()
+    assert ctx["install_dir"] == expected_install_dir
+    assert ctx["log_file"] == expected_install_dir / "logs" / "install.log"
+    assert ctx["config_dir"] == expected_root
 
     cli_args = install.parse_args(
         ["--install-dir", str(tmp_path / "cli_dir"), "--config", str(cfg_path)]
     )
     ctx_cli = install.resolve_paths(config, cli_args)
-    assert ctx_cli["install_dir"] == (tmp_path / "cli_dir").resolve()
+    assert ctx_cli["install_dir"] == expected_root / "cli_dir"
 
 
 def test_list_modules_output(valid_config, capsys):
     _, config_data = valid_config
     install.list_modules(config_data)
     captured = capsys.readouterr().out
-    assert "dev" in captured
-    assert "essentials" in captured
-    assert "✓" in captured
+    assert set(_LIST_OUTPUT_RE.findall(captured)) >= {"dev", "essentials", "✓"}
 
 
 def test_select_modules_behaviour(valid_config):
@@ -249,6 +250,7 @@ def test_op_copy_file_behaviour(tmp_path):
     assert dst.read_text(encoding="utf-8") == "second"
 
 
+@pytest.mark.slow
 def test_op_run_command_success(tmp_path):
     ctx = make_ctx(tmp_path)
     install.ensure_install_dir(ctx["install_dir"])
@@ -257,6 +259,7 @@ def test_op_run_command_success(tmp_path):
     assert "hello" in log_content
 
 
+@pytest.mark.slow
 def test_op_run_command_failure(tmp_path):
     ctx = make_ctx(tmp_path)
     install.ensure_install_dir(ctx["install_dir"])
@@ -309,6 +312,23 @@ def test_write_log_and_status(tmp_path):
     assert status_data["modules"]["dev"]["status"] == "success"
 
 
+def test_write_log_reuses_open_fd(tmp_path):
+    ctx = make_ctx(tmp_path)
+    install.ensure_install_dir(ctx["install_dir"])
+
+    install.open_log(ctx)
+    assert isinstance(ctx["log_fd"], int)
+    install.write_log({"level": "INFO", "message": "first"}, ctx)
+    install.write_log({"level": "INFO", "message": "second", "returncode": 0}, ctx)
+    install.close_log(ctx)
+    assert "log_fd" not in ctx
+
+    lines = ctx["log_file"].read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("INFO: first")
+    assert lines[1].endswith("INFO: second")
+    assert lines[2] == "  returncode: 0"
+
+
 def test_main_success(valid_config, tmp_path):
     cfg_path, _ = valid_config
     install_dir = tmp_path / "install_final"
@@ -328,6 +348,7 @@ def test_main_success(valid_config, tmp_path):
     assert (install_dir / "installed_modules.json").exists()
 
 
+@pytest.mark.slow
 def test_main_failure_without_force(tmp_path):
     cfg = {
         "version": "1.0",
@@ -392,6 +413,7 @@ def test_main_failure_without_force(tmp_path):
     assert not (install_dir / "installed_modules.json").exists()
 
 
+@pytest.mark.slow
 def test_main_force_records_failure(tmp_path):
     cfg = {
         "version": "1.0",
@@ -6,14 +6,7 @@ from pathlib import Path
 import pytest
 
 import install
-
-
-ROOT = Path(__file__).resolve().parents[1]
-SCHEMA_PATH = ROOT / "config.schema.json"
-
-
-def _write_schema(target_dir: Path) -> None:
-    shutil.copy(SCHEMA_PATH, target_dir / "config.schema.json")
+from _paths import link_schema
 
 
 def _base_config(install_dir: Path, modules: dict) -> dict:
@@ -31,31 +24,38 @@ def _prepare_env(tmp_path: Path, modules: dict) -> tuple[Path, Path, Path]:
     config_dir = tmp_path / "config"
     install_dir = tmp_path / "install"
     config_dir.mkdir()
-    _write_schema(config_dir)
+    link_schema(config_dir / "config.schema.json")
 
     cfg_path = config_dir / "config.json"
-    cfg_path.write_text(
-        json.dumps(_base_config(install_dir, modules)), encoding="utf-8"
+    cfg_path.write_bytes(
+        json.dumps(_base_config(install_dir, modules)).encode("utf-8")
     )
     return cfg_path, install_dir, config_dir
 
 
-def _sample_sources(config_dir: Path) -> dict:
-    sample_dir = config_dir / "sample_dir"
+@pytest.fixture(scope="session")
+def sample_template(tmp_path_factory) -> Path:
+    """Build the sample source tree once; tests copy it into their config dir."""
+
+    template = tmp_path_factory.mktemp("sample_template")
+    sample_dir = template / "sample_dir"
     sample_dir.mkdir()
     (sample_dir / "nested.txt").write_text("dir-content", encoding="utf-8")
+    (template / "sample.txt").write_text("file-content", encoding="utf-8")
+    return template
 
-    sample_file = config_dir / "sample.txt"
-    sample_file.write_text("file-content", encoding="utf-8")
 
-    return {"dir": sample_dir, "file": sample_file}
+def _sample_sources(template: Path, config_dir: Path) -> dict:
+    shutil.copytree(template, config_dir, dirs_exist_ok=True)
+    return {"dir": config_dir / "sample_dir", "file": config_dir / "sample.txt"}
 
 
 def _read_status(install_dir: Path) -> dict:
     return json.loads((install_dir / "installed_modules.json").read_text("utf-8"))
 
 
-def test_single_module_full_flow(tmp_path):
+@pytest.mark.slow
+def test_single_module_full_flow(tmp_path, sample_template):
     cfg_path, install_dir, config_dir = _prepare_env(
         tmp_path,
         {
@@ -78,7 +78,7 @@ def test_single_module_full_flow(tmp_path):
         },
     )
 
-    _sample_sources(config_dir)
+    _sample_sources(sample_template, config_dir)
     rc = install.main(["--config", str(cfg_path), "--module", "solo"])
 
     assert rc == 0
@@ -91,7 +91,7 @@ def test_single_module_full_flow(tmp_path):
     assert len(status["modules"]["solo"]["operations"]) == 3
 
 
-def test_multi_module_install_and_status(tmp_path):
+def test_multi_module_install_and_status(tmp_path, sample_template):
     modules = {
         "alpha": {
             "enabled": True,
@@ -118,7 +118,7 @@ def test_multi_module_install_and_status(tmp_path):
     }
 
     cfg_path, install_dir, config_dir = _prepare_env(tmp_path, modules)
-    _sample_sources(config_dir)
+    _sample_sources(sample_template, config_dir)
 
     rc = install.main(["--config", str(cfg_path)])
     assert rc == 0
@@ -131,7 +131,7 @@ def test_multi_module_install_and_status(tmp_path):
     assert all(mod["status"] == "success" for mod in status["modules"].values())
 
 
-def test_force_overwrites_existing_files(tmp_path):
+def test_force_overwrites_existing_files(tmp_path, sample_template):
     modules = {
         "forcey": {
             "enabled": True,
@@ -147,7 +147,7 @@ def test_force_overwrites_existing_files(tmp_path):
     }
 
     cfg_path, install_dir, config_dir = _prepare_env(tmp_path, modules)
-    sources = _sample_sources(config_dir)
+    sources = _sample_sources(sample_template, config_dir)
 
     install.main(["--config", str(cfg_path), "--module", "forcey"])
     assert (install_dir / "target.txt").read_text(encoding="utf-8") == "file-content"
@@ -162,7 +162,8 @@ def test_force_overwrites_existing_files(tmp_path):
     assert status["modules"]["forcey"]["status"] == "success"
 
 
-def test_failure_triggers_rollback_and_restores_status(tmp_path):
+@pytest.mark.slow
+def test_failure_triggers_rollback_and_restores_status(tmp_path, sample_template):
     # First successful run to create a known-good status file.
     ok_modules = {
         "stable": {
@@ -179,7 +180,7 @@ def test_failure_triggers_rollback_and_restores_status(tmp_path):
     }
 
     cfg_path, install_dir, config_dir = _prepare_env(tmp_path, ok_modules)
-    _sample_sources(config_dir)
+    _sample_sources(sample_template, config_dir)
     assert install.main(["--config", str(cfg_path)]) == 0
     pre_status = _read_status(install_dir)
     assert "stable" in pre_status["modules"]
@@ -204,8 +205,8 @@ def test_failure_triggers_rollback_and_restores_status(tmp_path):
         },
     }
 
-    cfg_path.write_text(
-        json.dumps(_base_config(install_dir, failing_modules)), encoding="utf-8"
+    cfg_path.write_bytes(
+        json.dumps(_base_config(install_dir, failing_modules)).encode("utf-8")
     )
 
     rc = install.main(["--config", str(cfg_path)])